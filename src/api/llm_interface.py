@@ -1,52 +1,53 @@
 """
 AID: /src/api/llm_interface.py
 Proof ID: PRF-LLM-INT-003-GOLD
+
+Thin wrapper over `src.llm_interface`, which holds the single implementation
+of the Ollama synapse. This import path keeps its historical defaults: the
+"SYSTEM RULE / USER PROMPT" prompt layout, a 120 s timeout and a 4096-token
+`num_predict` unless `max_tokens` is given.
 """
-import requests
-import os
-import json
-import time
-
-# Configuration: Defaults to local Ollama instance
-OLLAMA_API_URL = os.environ.get("OLLAMA_API", "http://localhost:11434/api/generate")
-DEFAULT_MODEL = "qwen2.5:3b"
-
-def check_connection() -> bool:
-	"""Ping the Ollama server to ensure it's alive."""
-	try:
-		res = requests.get(OLLAMA_API_URL.replace("/api/generate", ""), timeout=2)
-		return res.status_code == 200
-	except:
-		return False
-
-def query_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 120, **kwargs) -> str:
-	"""
-	Robust Synapse function to query Qwen via Ollama API.
-	Supports dynamic model switching, custom timeouts, and retries.
-	"""
-	full_prompt = f"SYSTEM RULE: {system_rule}\n\nUSER PROMPT: {prompt}"
-    
-	payload = {
-		"model": model,
-		"prompt": full_prompt,
-		"stream": False,
-		"options": {
-			"temperature": kwargs.get("temperature", 0.7),
-			"num_predict": kwargs.get("max_tokens", 4096)
-		}
-	}
-    
-	try:
-		response = requests.post(OLLAMA_API_URL, json=payload, timeout=timeout)
-		if response.status_code == 200:
-			data = response.json()
-			return data.get("response", "")
-		else:
-			return f"[ERROR] API returned {response.status_code}: {response.text}"
-            
-	except requests.exceptions.ConnectionError:
-		return "[CRITICAL] Ollama is offline. Is the Docker container running?"
-	except requests.exceptions.ReadTimeout:
-		return f"[ERROR] Request timed out after {timeout} seconds."
-	except Exception as e:
-		return f"[ERROR] Connection Fault: {str(e)}"
+import asyncio
+from typing import Iterator, List, Union
+
+from src.llm_interface import (
+    DEFAULT_MODEL,
+    OLLAMA_API_URL,
+    _generate,
+    check_connection,
+)
+
+__all__ = [
+    "DEFAULT_MODEL",
+    "OLLAMA_API_URL",
+    "aquery_qwen",
+    "batch_query_qwen",
+    "check_connection",
+    "query_qwen",
+]
+
+_PROMPT_TEMPLATE = "SYSTEM RULE: {system_rule}\n\nUSER PROMPT: {prompt}"
+_DEFAULT_MAX_TOKENS = 4096
+
+
+def query_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 120, stream: bool = False, **kwargs) -> Union[str, Iterator[str]]:
+    """
+    Robust Synapse function to query Qwen via Ollama API.
+    Supports dynamic model switching, custom timeouts, and streaming.
+    """
+    if kwargs.get("max_tokens") is None:
+        kwargs["max_tokens"] = _DEFAULT_MAX_TOKENS
+    full_prompt = _PROMPT_TEMPLATE.format(system_rule=system_rule, prompt=prompt)
+    return _generate(full_prompt, model, timeout, stream, **kwargs)
+
+
+async def aquery_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 120, **kwargs) -> str:
+    """Awaitable `query_qwen`: runs the blocking call on a worker thread."""
+    return await asyncio.to_thread(query_qwen, prompt, system_rule, model, timeout, False, **kwargs)
+
+
+async def batch_query_qwen(prompts: List[str], system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 120, **kwargs) -> List[str]:
+    """Issue independent prompts concurrently; results keep the input order."""
+    return list(await asyncio.gather(
+        *(aquery_qwen(p, system_rule, model, timeout, **kwargs) for p in prompts)
+    ))
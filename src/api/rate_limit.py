@@ -0,0 +1,66 @@
+"""
+AID: /src/api/rate_limit.py
+Purpose: In-process token-bucket rate limiting for the Sovereign API.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from fastapi import HTTPException, Request
+
+
+class TokenBucketLimiter:
+    """Per-key token bucket: `capacity` burst, refilled at `rate` tokens/sec.
+
+    Unlike a fixed window there is no boundary burst, and a bucket is just
+    (tokens, last_refill) per key. At most `max_keys` buckets are kept; the
+    least recently used one is dropped first, which only ever hands an idle
+    client back a full bucket. State is per-process; each worker enforces
+    its own budget.
+    """
+
+    def __init__(self, rate: float, capacity: float, max_keys: int = 10000):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> float:
+        """Take one token for `key`. Returns 0.0 if allowed, else seconds until a token is available."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - ts) * self.rate)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0 if allowed else (1.0 - tokens) / self.rate
+
+
+def _client_key(request: Request) -> str:
+    # Client address only: request headers are caller-controlled and would
+    # let a client mint a fresh bucket per request
+    return request.client.host if request.client else "unknown"
+
+
+def token_bucket(name: str, rate: float, capacity: float) -> Callable:
+    """FastAPI dependency enforcing a token bucket keyed by client address."""
+    limiter = TokenBucketLimiter(rate, capacity)
+
+    def dependency(request: Request) -> None:
+        wait = limiter.acquire(_client_key(request))
+        if wait:
+            raise HTTPException(
+                429,
+                f'Rate limit exceeded for {name}',
+                headers={'Retry-After': str(math.ceil(wait))},
+            )
+
+    return dependency
@@ -1,36 +1,44 @@
 ﻿import os
-import yaml
-from fastapi import FastAPI, HTTPException, Header, Request
+import re
+import asyncio
+import hashlib
+import hmac
+import threading
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Header, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from pathlib import Path
+from src.api.rate_limit import token_bucket
 from src.ledger.integrity_ledger import IntegrityLedger, LedgerError
 from src.runtime.council_router import CouncilRouter
 
+CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / 'config' / 'master_config.yaml'
+
 def load_config():
-    base = Path(__file__).resolve().parent.parent.parent
-    cfg = base / 'config' / 'master_config.yaml'
-    if cfg.exists():
-        with open(cfg, 'r') as f: return yaml.safe_load(f)
+    if CONFIG_PATH.exists():
+        import yaml  # deferred: only paid when a config file actually exists
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # libyaml when available
+        with open(CONFIG_PATH, 'r') as f: return yaml.load(f, Loader=loader) or {}
     return {}
 
 conf = load_config()
 API_KEY = os.getenv(conf.get('security', {}).get('api_key_env', 'KT_API_KEY'), 'kthitl_dev')
+_API_KEY_HASH = hashlib.sha256(API_KEY.encode()).digest()
 
-limiter = Limiter(key_func=get_remote_address)
 app = FastAPI(title='KT-v53.6 Sovereign Interface')
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 templates = Jinja2Templates(directory=str(os.path.join(os.path.dirname(__file__), 'templates')))
 app.mount('/static', StaticFiles(directory=str(os.path.join(os.path.dirname(__file__), 'static'))), name='static')
 
 ledger = IntegrityLedger(conf=conf)
+# Serializes chain-tail updates between request handlers and background seals
+_ledger_lock = threading.Lock()
+
+def _seal_block(batch_size: int) -> None:
+    with _ledger_lock:
+        ledger.seal_block(batch_size=batch_size)
 
 # Initialize Council Router for Sovereign Interface
 try:
@@ -39,6 +47,15 @@ except Exception as e:
     print(f"Warning: Council Router not available: {e}")
     council = None
 
+def _api_key_valid(x_api_key) -> bool:
+    # Constant-time compare of fixed-length digests; no early exit on the first differing byte
+    return bool(x_api_key) and hmac.compare_digest(hashlib.sha256(x_api_key.encode()).digest(), _API_KEY_HASH)
+
+VALID_MODES = frozenset({'DEAN', 'ENGINEER', 'ARBITER', 'TA'})
+_VETO_KEYWORDS = ('hack', 'exploit', 'bypass', 'jailbreak')
+# One case-insensitive pass over the warrant instead of a lower() copy plus a scan per keyword
+_VETO_RE = re.compile('|'.join(map(re.escape, _VETO_KEYWORDS)), re.IGNORECASE)
+
 class ApprovalRequest(BaseModel):
     token: str
     signature: str
@@ -57,18 +74,18 @@ def sovereign_interface(request: Request):
     """Sovereign Interface v2.0 - Constitutional Cockpit"""
     return templates.TemplateResponse('sovereign.html', {'request': request})
 
-@app.post('/approve')
-@limiter.limit('5/minute')
-def approve_proposal(req: ApprovalRequest, request: Request, x_api_key: str = Header(None)):
-    if x_api_key!= API_KEY:
+@app.post('/approve', dependencies=[Depends(token_bucket('approve', rate=5/60, capacity=5))])
+def approve_proposal(req: ApprovalRequest, request: Request, background_tasks: BackgroundTasks, x_api_key: str = Header(None)):
+    if not _api_key_valid(x_api_key):
         raise HTTPException(401, 'Unauthorized')
     if len(req.rationale.strip()) < 10:
         raise HTTPException(400, 'Rationale too short')
 
     try:
-        tx_hash = ledger.finalize_proposal(req.token, req.signature, req.rationale, kid='operator.pub')
-        # Platinum: Auto-trigger block seal check for demo purposes
-        ledger.seal_block(batch_size=5)
+        with _ledger_lock:
+            tx_hash = ledger.finalize_proposal(req.token, req.signature, req.rationale, kid='operator.pub')
+        # Platinum: Auto-trigger block seal check for demo purposes (after the response is sent)
+        background_tasks.add_task(_seal_block, batch_size=5)
         return {'status': 'COMMITTED', 'tx_hash': tx_hash}
     except LedgerError as e:
         code_map = {'INVALID_TOKEN':404, 'TOKEN_EXPIRED':408, 'INVALID_SIGNATURE':403, 'CHAIN_DIVERGENCE':409}
@@ -76,8 +93,7 @@ def approve_proposal(req: ApprovalRequest, request: Request, x_api_key: str = He
     except Exception as e:
         return JSONResponse(status_code=500, content={'error': 'INTERNAL_ERROR', 'message': str(e)})
 
-@app.post('/api/sovereign/decree')
-@limiter.limit('30/minute')
+@app.post('/api/sovereign/decree', dependencies=[Depends(token_bucket('decree', rate=30/60, capacity=30))])
 async def sovereign_decree(req: SovereignWarrant, request: Request, x_api_key: str = Header(None)):
     """
     Sovereign Interface Endpoint
@@ -86,7 +102,7 @@ async def sovereign_decree(req: SovereignWarrant, request: Request, x_api_key: s
     This is the constitutional backend for the Sovereign Cockpit.
     """
     # Optional: API key check (can be disabled for local use)
-    # if x_api_key != API_KEY:
+    # if not _api_key_valid(x_api_key):
     #     raise HTTPException(401, 'Unauthorized')
     
     if not council:
@@ -96,32 +112,31 @@ async def sovereign_decree(req: SovereignWarrant, request: Request, x_api_key: s
         raise HTTPException(400, 'Warrant too short')
     
     # Validate mode
-    valid_modes = ['DEAN', 'ENGINEER', 'ARBITER', 'TA']
-    if req.mode not in valid_modes:
-        raise HTTPException(400, f'Invalid mode. Must be one of: {valid_modes}')
+    if req.mode not in VALID_MODES:
+        raise HTTPException(400, f'Invalid mode. Must be one of: {sorted(VALID_MODES)}')
     
+    # Check for constitutional violations (simple heuristic) before spending
+    # any tokens on the Council. In production, integrate with actual governance layer
+    if _VETO_RE.search(req.warrant):
+        return JSONResponse(
+            status_code=200,
+            content={
+                'status': 'VETO',
+                'veto': True,
+                'message': 'Constitutional violation: Attempted bypass of safety protocols'
+            }
+        )
+
     try:
-        # Route warrant to Council
-        response = council.route_request(
+        # Route warrant to Council off the event loop
+        response = await asyncio.to_thread(
+            council.route_request,
             role=req.mode,
             prompt=req.warrant,
             system_msg=f"You are operating in {req.mode} mode for King's Theorem Sovereign Interface.",
             max_tokens=2048
         )
         
-        # Check for constitutional violations (simple heuristic)
-        # In production, integrate with actual governance layer
-        veto_keywords = ['hack', 'exploit', 'bypass', 'jailbreak']
-        if any(keyword in req.warrant.lower() for keyword in veto_keywords):
-            return JSONResponse(
-                status_code=200,
-                content={
-                    'status': 'VETO',
-                    'veto': True,
-                    'message': 'Constitutional violation: Attempted bypass of safety protocols'
-                }
-            )
-        
         return {
             'status': 'DECREE',
             'decree': response,
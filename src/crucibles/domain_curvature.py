@@ -4,14 +4,19 @@ Domain Curvature Generator - Non-Euclidean Paradox Seeds
 Generates paradoxes with exotic geometric properties.
 """
 
-import sys
-from pathlib import Path
+import re
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.runtime.council_router import CouncilRouter
+# Phrases signalling a curved paradox collapsed to Euclidean logic, matched in one pass
+_FLATTENING_MARKERS = (
+    "linearizes",
+    "reduces to classical logic",
+    "flattens",
+    "normalizes",
+    "becomes euclidean",
+    "classical resolution",
+)
+_FLATTENING_RE = re.compile("|".join(map(re.escape, _FLATTENING_MARKERS)), re.IGNORECASE)
 
 
 class DomainCurvatureGenerator:
@@ -25,6 +30,82 @@ class DomainCurvatureGenerator:
     - retrocausal: Time-reversed causal structures
     """
 
+    # PHASE 4: Curvature-aware temperatures
+    _CURVATURE_TEMPS = {
+        "hyperbolic": 1.10,
+        "elliptic": 1.15,
+        "parabolic": 1.20,
+        "retrocausal": 1.30,
+    }
+
+    # Curvature-specific prompts (formatted with the domain per call). The domain
+    # comes last so the static head is an identical prefix for provider prompt caching.
+    _CURVATURE_PROMPTS = {
+        "hyperbolic": """Generate a paradox with HYPERBOLIC (negative) curvature.
+
+Properties:
+- Logic paths DIVERGE exponentially
+- Multiple valid but contradictory resolutions exist
+- The more you analyze, the more solutions appear
+- Infinite interpretations in finite space
+
+Example: A proof that simultaneously validates and invalidates itself through path divergence.
+
+Output ONLY the paradox. Make it concrete and unsolvable through flat logic.
+
+Domain: {domain}""",
+        "elliptic": """Generate a paradox with ELLIPTIC (positive) curvature.
+
+Properties:
+- Logic paths CONVERGE to a singularity
+- All reasoning loops back to the same contradiction
+- Escape attempts circle back to origin
+- Finite interpretations in bounded space
+
+Example: A statement that, no matter how you approach it, always leads to the same impossible conclusion.
+
+Output ONLY the paradox. Make it concrete and loop-invariant.
+
+Domain: {domain}""",
+        "parabolic": """Generate a paradox with PARABOLIC (zero) curvature.
+
+Properties:
+- Logic paths remain PARALLEL but never meet
+- Multiple independent contradictions coexist
+- No interaction between paradox layers
+- Infinite non-interacting solutions
+
+Example: Two completely separate paradoxes that share the same statement but never resolve each other.
+
+Output ONLY the paradox. Make it have parallel contradictions.
+
+Domain: {domain}""",
+        "retrocausal": """Generate a paradox with RETROCAUSAL structure.
+
+Properties:
+- Effects precede causes
+- Future states determine past logic
+- Knowledge of the solution changes the problem
+- Observer's conclusion alters the premise
+
+Example: A paradox where knowing the answer makes the question impossible.
+
+Output ONLY the paradox. Make it temporally reversed.
+
+Domain: {domain}""",
+    }
+
+    _SYSTEM_MSGS = {
+        ct: (
+            f"You are a geometric logician. Generate {ct} paradoxes "
+            "that preserve non-Euclidean structure. Never flatten to classical logic."
+        )
+        for ct in _CURVATURE_PROMPTS
+    }
+
+    # Case-insensitive curvature-name check, so responses aren't lowercased per attempt
+    _CURVATURE_MARKERS = {ct: re.compile(re.escape(ct), re.IGNORECASE) for ct in _CURVATURE_PROMPTS}
+
     def __init__(
         self,
         verbose: bool = True,
@@ -39,6 +120,9 @@ class DomainCurvatureGenerator:
         """
         self.verbose = verbose
         self.base_temperature = base_temperature
+
+        # Imported here so detect_flattening and the class constants are usable without the router stack
+        from src.runtime.council_router import CouncilRouter
         self.council = CouncilRouter()
 
     def _log(self, message: str) -> None:
@@ -57,15 +141,7 @@ class DomainCurvatureGenerator:
         Returns:
             True if flattening detected, False otherwise
         """
-        markers = [
-            "linearizes",
-            "reduces to classical logic",
-            "flattens",
-            "normalizes",
-            "becomes euclidean",
-            "classical resolution",
-        ]
-        return any(marker in paradox.lower() for marker in markers)
+        return _FLATTENING_RE.search(paradox) is not None
 
     def generate(
         self,
@@ -84,83 +160,17 @@ class DomainCurvatureGenerator:
         Returns:
             Paradox seed string or None on failure
         """
-        # PHASE 4: Curvature-aware temperatures
-        curvature_temp_map = {
-            "hyperbolic": 1.10,
-            "elliptic": 1.15,
-            "parabolic": 1.20,
-            "retrocausal": 1.30,
-        }
-        
-        temp = curvature_temp_map.get(curvature_type, self.base_temperature)
-
-        # Curvature-specific prompts
-        curvature_prompts = {
-            "hyperbolic": """Generate a paradox with HYPERBOLIC (negative) curvature.
-
-Properties:
-- Logic paths DIVERGE exponentially
-- Multiple valid but contradictory resolutions exist
-- The more you analyze, the more solutions appear
-- Infinite interpretations in finite space
-
-Example: A proof that simultaneously validates and invalidates itself through path divergence.
-
-Domain: {domain}
-
-Output ONLY the paradox. Make it concrete and unsolvable through flat logic.""",
-            "elliptic": """Generate a paradox with ELLIPTIC (positive) curvature.
-
-Properties:
-- Logic paths CONVERGE to a singularity
-- All reasoning loops back to the same contradiction
-- Escape attempts circle back to origin
-- Finite interpretations in bounded space
-
-Example: A statement that, no matter how you approach it, always leads to the same impossible conclusion.
-
-Domain: {domain}
-
-Output ONLY the paradox. Make it concrete and loop-invariant.""",
-            "parabolic": """Generate a paradox with PARABOLIC (zero) curvature.
+        temp = self._CURVATURE_TEMPS.get(curvature_type, self.base_temperature)
 
-Properties:
-- Logic paths remain PARALLEL but never meet
-- Multiple independent contradictions coexist
-- No interaction between paradox layers
-- Infinite non-interacting solutions
-
-Example: Two completely separate paradoxes that share the same statement but never resolve each other.
-
-Domain: {domain}
-
-Output ONLY the paradox. Make it have parallel contradictions.""",
-            "retrocausal": """Generate a paradox with RETROCAUSAL structure.
-
-Properties:
-- Effects precede causes
-- Future states determine past logic
-- Knowledge of the solution changes the problem
-- Observer's conclusion alters the premise
-
-Example: A paradox where knowing the answer makes the question impossible.
-
-Domain: {domain}
-
-Output ONLY the paradox. Make it temporally reversed.""",
-        }
-
-        prompt_template = curvature_prompts.get(curvature_type)
+        prompt_template = self._CURVATURE_PROMPTS.get(curvature_type)
         if not prompt_template:
             self._log(f"⚠️  Unknown curvature type: {curvature_type}")
             return None
 
         prompt = prompt_template.format(domain=domain)
         
-        system_msg = (
-            f"You are a geometric logician. Generate {curvature_type} paradoxes "
-            "that preserve non-Euclidean structure. Never flatten to classical logic."
-        )
+        system_msg = self._SYSTEM_MSGS[curvature_type]
+        curvature_marker = self._CURVATURE_MARKERS[curvature_type]
 
         # Retry loop with flattening detection
         for attempt in range(max_attempts):
@@ -176,19 +186,18 @@ Output ONLY the paradox. Make it temporally reversed.""",
                     temperature=temp,
                 )
 
-                if not response or len(response.strip()) < 50:
+                paradox = response.strip() if response else ""
+                if len(paradox) < 50:
                     self._log(f"   ⚠️  Insufficient content generated")
                     continue
 
-                paradox = response.strip()
-
                 # PHASE 5: Flattening detection
                 if self.detect_flattening(paradox):
                     self._log(f"   ⚠️  Flattening detected, retrying...")
                     continue
 
                 # Verify curvature preservation
-                if curvature_type.lower() not in paradox.lower():
+                if not curvature_marker.search(paradox):
                     # Add explicit curvature marker if missing
                     paradox = f"[{curvature_type.upper()} CURVATURE]\n{paradox}"
 
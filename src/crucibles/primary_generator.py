@@ -12,12 +12,76 @@ Architecture:
 The Spartan Reset: Alien complexity is the new Level 1.
 """
 
+import asyncio
+import re
 import time
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from src.runtime.council_router import CouncilRouter
+
+# Forge prompt templates and system messages: static text, built once at import.
+# Variable text always goes last so every call shares the longest possible static
+# prefix, which is what provider-side prompt caching keys on.
+_PARADOX_PROMPT = """Hard requirements for the paradox:
+- Recursive temporal dependencies (laws that affect past and future states)
+- At least 3 agents with partial observability (e.g., Bank, Regulator, Client)
+- A Meta-Logic Trap where the validity of one rule depends on another that retroactively changes the first
+- The scenario must be logically solvable in principle (no pure gibberish)
+
+Make it Alien-level complex. This is training data for a superintelligence.
+
+Generate a LEVEL 10 paradox {dom_text}."""
+_PARADOX_SYSTEM = "You are the Architect of Impossible Logic. Your paradoxes train future AGI systems."
+
+_DECONSTRUCT_PROMPT = """You are the Universal Translator.
+
+Take the following Alien-Tier Paradox and DO NOT merely answer it.
+Instead, DECONSTRUCT the reasoning step-by-step so a small student model can learn.
+
+Requirements:
+1. Explicitly identify the Meta-Logic Trap and explain it
+2. Map all Temporal Dependencies (past → present → future loops)
+3. List each agent and what they do and DO NOT know
+4. Show the Bayesian inference steps used to reconstruct missing information
+5. Provide the Final Ruling / Resolution with justification
+6. Explain why each step matters for a future superintelligence
+
+Make the impossible learnable WITHOUT dumbing it down.
+
+PARADOX:
+{paradox}
+"""
+_DECONSTRUCT_SYSTEM = "You are the Universal Translator. Make the impossible learnable without simplifying the logic."
+
+_SCORING_PROMPT = """You are a Reward Model evaluating EDUCATIONAL CLARITY and LOGICAL VALIDITY.
+
+Rate the following complex-paradox explanation on a scale from 0.0 to 1.0.
+
+Consider:
+- Is the logic consistent and non-contradictory?
+- Are the steps clearly explained?
+- Is the Meta-Logic and Temporal structure preserved correctly?
+- Would this be useful training data for a small student model to learn superintelligence-level reasoning?
+
+Return ONLY a bare number like:
+0.73
+0.91
+0.99
+
+No other text.
+
+EXPLANATION:
+{solution_trace}
+"""
+_SCORING_SYSTEM = "You are the Gatekeeper of Logical Purity. Return ONLY the numeric score."
+
+# Scorer reply: a number labelled "score"/"rating" (last one wins), else a
+# reply that is nothing but the number (optionally "/1" or "/1.0"). Stray
+# numbers such as "0.0-1.0 scale" or list markers ("1.") are never taken.
+_NUMBER = r"[-+]?\d*\.?\d+"
+_SCORE_LABELLED_RE = re.compile(rf"(?:score|rating)\s*[:=]?\s*({_NUMBER})", re.IGNORECASE)
+_SCORE_BARE_RE = re.compile(rf"\s*({_NUMBER})(?:\s*/\s*1(?:\.0+)?)?\s*")
 
 
 class SpartanCurriculumGenerator:
@@ -31,13 +95,18 @@ class SpartanCurriculumGenerator:
     - Nemotron-approved (≥0.90 educational clarity score)
     """
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, cache_db: Optional[str] = None):
         """Initialize the Spartan generator with Council Router.
         
         Args:
             verbose: Enable detailed logging of generation process
+            cache_db: Optional SQLite path to persist Forge B/C responses across runs
         """
-        self.council = CouncilRouter()
+        # Imported here so importing this module doesn't pull in the router stack
+        from src.runtime.cached_council_router import CachedCouncilRouter
+        from src.runtime.council_router import CouncilRouter
+
+        self.council = CachedCouncilRouter(CouncilRouter(), db_path=cache_db)
         self.verbose = verbose
 
     def _log(self, msg: str) -> None:
@@ -69,22 +138,15 @@ class SpartanCurriculumGenerator:
         
         self._log(f"\n[FIRE] [Forge A] Generating Alien Paradox ({dom_text})...")
         
-        paradox_prompt = f"""Generate a LEVEL 10 paradox {dom_text}.
-
-Hard requirements:
-- Recursive temporal dependencies (laws that affect past and future states)
-- At least 3 agents with partial observability (e.g., Bank, Regulator, Client)
-- A Meta-Logic Trap where the validity of one rule depends on another that retroactively changes the first
-- The scenario must be logically solvable in principle (no pure gibberish)
-
-Make it Alien-level complex. This is training data for a superintelligence."""
+        paradox_prompt = _PARADOX_PROMPT.format(dom_text=dom_text)
 
         try:
             paradox = self.council.route_request(
                 role="DEAN",
                 prompt=paradox_prompt,
-                system_msg="You are the Architect of Impossible Logic. Your paradoxes train future AGI systems.",
-                max_tokens=2000
+                system_msg=_PARADOX_SYSTEM,
+                max_tokens=2000,
+                use_cache=False  # Each trace needs a fresh paradox
             )
         except Exception as e:
             self._log(f"[ERROR] Forge A Exception: {e}")
@@ -99,30 +161,13 @@ Make it Alien-level complex. This is training data for a superintelligence."""
         # ----------------------------------------------------------
         self._log("[DIAMOND] [Forge B] Deconstructing via Gemini Explainer...")
         
-        solution_prompt = f"""You are the Universal Translator.
-
-Take the following Alien-Tier Paradox and DO NOT merely answer it.
-Instead, DECONSTRUCT the reasoning step-by-step so a small student model can learn.
-
-Requirements:
-1. Explicitly identify the Meta-Logic Trap and explain it
-2. Map all Temporal Dependencies (past → present → future loops)
-3. List each agent and what they do and DO NOT know
-4. Show the Bayesian inference steps used to reconstruct missing information
-5. Provide the Final Ruling / Resolution with justification
-6. Explain why each step matters for a future superintelligence
-
-Make the impossible learnable WITHOUT dumbing it down.
-
-PARADOX:
-{paradox}
-"""
+        solution_prompt = _DECONSTRUCT_PROMPT.format(paradox=paradox)
 
         try:
             solution_trace = self.council.route_request(
                 role="ARBITER",  # Router should map to Gemini 1.5 Pro for explanation
                 prompt=solution_prompt,
-                system_msg="You are the Universal Translator. Make the impossible learnable without simplifying the logic.",
+                system_msg=_DECONSTRUCT_SYSTEM,
                 max_tokens=3000
             )
         except Exception as e:
@@ -138,46 +183,29 @@ PARADOX:
         # ----------------------------------------------------------
         self._log("[SHIELD] [Forge C] Scoring via Nemotron Reward Model...")
         
-        scoring_prompt = f"""You are a Reward Model evaluating EDUCATIONAL CLARITY and LOGICAL VALIDITY.
-
-Rate the following complex-paradox explanation on a scale from 0.0 to 1.0.
-
-Consider:
-- Is the logic consistent and non-contradictory?
-- Are the steps clearly explained?
-- Is the Meta-Logic and Temporal structure preserved correctly?
-- Would this be useful training data for a small student model to learn superintelligence-level reasoning?
-
-Return ONLY a bare number like:
-0.73
-0.91
-0.99
-
-No other text.
-
-EXPLANATION:
-{solution_trace}
-"""
+        scoring_prompt = _SCORING_PROMPT.format(solution_trace=solution_trace)
 
         try:
             score_raw = self.council.route_request(
                 role="ARBITER",  # Router should map to Nemotron-70B-Reward for scoring
                 prompt=scoring_prompt,
-                system_msg="You are the Gatekeeper of Logical Purity. Return ONLY the numeric score.",
+                system_msg=_SCORING_SYSTEM,
                 max_tokens=10
             )
         except Exception as e:
             self._log(f"[ERROR] Forge C Exception: {e}")
             return None
 
-        # Parse score
-        score = None
-        try:
-            # Clean common artifacts
-            score_clean = score_raw.strip().replace("Score:", "").replace("Rating:", "").strip()
-            score = float(score_clean)
-        except Exception as e:
-            self._log(f"[ERROR] Forge C Failure: Cannot parse score from '{score_raw}': {e}")
+        # Parse score: "0.91", "0.91/1.0", "Score: 0.91", "... Rating = 0.91"
+        labelled = _SCORE_LABELLED_RE.findall(score_raw or "")
+        if labelled:
+            score = float(labelled[-1])
+        else:
+            m = _SCORE_BARE_RE.fullmatch(score_raw or "")
+            score = float(m.group(1)) if m else None
+        if score is None or not 0.0 <= score <= 1.0:
+            # Out-of-range numbers (e.g. "9/10") are rejected rather than misread
+            self._log(f"[ERROR] Forge C Failure: Cannot parse score from '{score_raw}'")
             return None
 
         self._log(f"   >> Nemotron Score = {score:.3f}")
@@ -202,3 +230,36 @@ EXPLANATION:
             "source": "Tri-Forged-Spartan",
             "complexity_level": 10
         }
+
+    async def generate_spartan_batch(
+        self,
+        domains: List[Optional[str]],
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the Tri-Forged pipeline for many domains concurrently.
+
+        The three forges inside one trace stay sequential (each feeds the next);
+        up to `concurrency` traces are in flight at once, each on a worker thread.
+
+        Args:
+            domains: One entry per trace to attempt (None = any domain)
+            concurrency: Maximum number of pipelines running at the same time
+
+        Returns:
+            Accepted traces, in the order of `domains`; rejected or failed ones are dropped
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(domain: Optional[str]) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return await asyncio.to_thread(self.generate_spartan_trace, domain)
+
+        results = await asyncio.gather(*(_one(d) for d in domains), return_exceptions=True)
+        accepted = []
+        for domain, result in zip(domains, results):
+            if isinstance(result, BaseException):
+                self._log(f"[ERROR] Pipeline for {domain or 'general'} raised: {result}")
+            elif result is not None:
+                accepted.append(result)
+        return accepted
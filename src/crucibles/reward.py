@@ -7,8 +7,10 @@ Provides scalar objective signal for curriculum quality assessment.
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class RewardComponents:
     """
     Scalar metrics used to compute the composite reward.
@@ -25,7 +27,7 @@ class RewardComponents:
     drift_variance: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RewardWeights:
     """
     Tunable weights for the composite reward.
@@ -44,6 +46,11 @@ def _clamp(value: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, value))
 
 
+def _clamp_array(values: np.ndarray, lo: float = 0.0, hi: float = 1.0) -> np.ndarray:
+    """Elementwise `_clamp`, including its NaN -> hi behaviour."""
+    return np.where(np.isnan(values), hi, np.clip(values, lo, hi))
+
+
 def compute_reward(
     components: RewardComponents,
     weights: Optional[RewardWeights] = None,
@@ -86,6 +93,43 @@ def compute_reward(
     return _clamp(reward)
 
 
+def compute_reward_batch(
+    components: np.ndarray,
+    weights: Optional[RewardWeights] = None,
+) -> np.ndarray:
+    """
+    Vectorized compute_reward over many samples at once.
+
+    Args:
+        components: (N, 4) array with columns ordered as RewardComponents
+            (contamination_rate, compression_density, fractal_score_gain, drift_variance);
+            a single (4,) row is treated as N=1
+        weights: Optional custom weights (uses defaults if None)
+
+    Returns:
+        (N,) array of rewards in [0, 1], matching compute_reward row by row
+
+    Raises:
+        ValueError: If components is not (N, 4) or (4,)
+    """
+    if weights is None:
+        weights = RewardWeights()
+
+    arr = np.atleast_2d(np.asarray(components, dtype=np.float64))
+    if arr.ndim != 2 or arr.shape[1] != 4:
+        raise ValueError(f"components must have shape (N, 4), got {arr.shape}")
+    w = np.array(
+        [weights.w_contamination, weights.w_compression, weights.w_fractal_gain, weights.w_drift]
+    )
+
+    # Same signals as compute_reward: invert the two "lower is better" columns
+    signals = arr.copy()
+    signals[:, 0] = 1.0 - arr[:, 0]
+    signals[:, 3] = 1.0 - arr[:, 3]
+
+    return _clamp_array(_clamp_array(signals) @ w)
+
+
 def analyze_reward_breakdown(
     components: RewardComponents,
     weights: Optional[RewardWeights] = None,
@@ -12,7 +12,7 @@ Key responsibilities:
 """
 
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 from src.crucibles.primary_generator import SpartanCurriculumGenerator
 
@@ -162,13 +162,28 @@ class SpartanCurriculum:
         Returns:
             List of accepted Spartan training examples
         """
-        out: List[Dict[str, Any]] = []
+        return list(self.stream(n, max_attempts_multiplier))
+
+    def stream(self, n: int, max_attempts_multiplier: int = 6) -> Iterator[Dict[str, Any]]:
+        """
+        Generator variant for lazy consumption.
+        Yields examples one at a time as they're generated, so a consumer can
+        write or train on each trace without waiting for (or holding) the batch.
+        
+        Args:
+            n: Target number of examples
+            max_attempts_multiplier: Maximum attempts per target example
+            
+        Yields:
+            Individual Spartan training examples
+        """
+        accepted = 0
         attempts = 0
         max_attempts = n * max_attempts_multiplier
         
         self._log(f"\n[SPARTAN CURRICULUM] Target: {n} examples, Max attempts: {max_attempts}")
         
-        while len(out) < n and attempts < max_attempts:
+        while accepted < n and attempts < max_attempts:
             attempts += 1
             self.stats["attempted"] += 1
             
@@ -176,42 +191,26 @@ class SpartanCurriculum:
             dom = self.sample_domain()
             self.stats["domains_used"].add(dom)
             
-            self._log(f"\n[CURRICULUM] Generating example {len(out)+1}/{n} in domain: {dom!r}")
+            self._log(f"\n[CURRICULUM] Generating example {accepted+1}/{n} in domain: {dom!r}")
             
             # Generate Spartan trace
             ex = self.generator.generate_spartan_trace(domain=dom)
             
             if ex is not None:
-                out.append(ex)
+                accepted += 1
                 self.stats["accepted"] += 1
-                self._log(f"[OK] Accepted (total={len(out)}, rate={self.stats['accepted']/self.stats['attempted']:.1%})")
+                self._log(f"[OK] Accepted (total={accepted}, rate={self.stats['accepted']/self.stats['attempted']:.1%})")
+                yield ex
             else:
                 self.stats["rejected"] += 1
                 self._log(f"[REJECT] Discarded by Spartan Gate (reject rate={self.stats['rejected']/self.stats['attempted']:.1%})")
         
         # Final statistics
         self._log(f"\n[COMPLETE] Spartan batch complete:")
-        self._log(f"  Accepted: {len(out)}/{n} ({len(out)/n:.1%})")
+        self._log(f"  Accepted: {accepted}/{n} ({accepted/n:.1%})")
         self._log(f"  Attempts: {attempts}")
-        self._log(f"  Success rate: {len(out)/attempts:.1%}")
+        self._log(f"  Success rate: {accepted/attempts:.1%}")
         self._log(f"  Domains covered: {len(self.stats['domains_used'])}")
-        
-        return out
-
-    def stream(self, n: int) -> List[Dict[str, Any]]:
-        """
-        Generator variant for lazy consumption.
-        Yields examples one at a time as they're generated.
-        
-        Args:
-            n: Target number of examples
-            
-        Yields:
-            Individual Spartan training examples
-        """
-        batch = self.generate_batch(n)
-        for ex in batch:
-            yield ex
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get current generation statistics.
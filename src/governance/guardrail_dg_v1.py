@@ -33,6 +33,25 @@ class DeontologicalGuardrail:
             "illegal activity",
             "market manipulation",
         ]
+        # Compiled rule state, rebuilt whenever the rule lists above change
+        self._rules_key = None
+
+    def _refresh_rules(self) -> None:
+        """Recompile derived rule state if the pattern/keyword lists were edited."""
+        key = (tuple(self.forbidden_patterns), tuple(self.forbidden_keywords))
+        if key == self._rules_key:
+            return
+        patterns, keywords = key
+        # One alternation scan covers the common clean case in a single pass;
+        # the ordered per-pattern scan only runs to attribute a hit.
+        self._forbidden_any = re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+        self._forbidden_compiled = [(p, re.compile(p)) for p in patterns]
+        # Lowercased keywords and their fuzzy window-length ranges
+        self._keywords_lower = tuple(kw.lower() for kw in keywords if kw)
+        self._fuzzy_windows = tuple(
+            (k, max(3, int(len(k) * 0.6)), int(len(k) * 1.4) + 1) for k in self._keywords_lower
+        )
+        self._rules_key = key
 
     def validate_content(self, text: str) -> Tuple[bool, str]:
         """
@@ -42,18 +61,20 @@ class DeontologicalGuardrail:
         if not text: return (False, "Empty Output")
         
         text_lower = text.lower()
+        self._refresh_rules()
         
-        for pattern in self.forbidden_patterns:
-            m = re.search(pattern, text_lower)
-            if m:
-                matched = m.group(0)
-                # Derive a readable concept from the pattern by removing regex tokens
-                concept = re.sub(r"\\[A-Za-z]", "", pattern)  # remove escaped tokens like \W, \s
-                concept = re.sub(r"[\[\]\-\_\.\?\s\*]", "", concept)
-                concept = re.sub(r"[^a-zA-Z]", "", concept).lower()
-                reason = f"Axiom 6 Violation: Detected pattern '{pattern}' matched '{matched}' (concept='{concept}')"
-                logger.warning("[GUARDRAIL] VETO: %s", reason)
-                return (False, reason)
+        if self._forbidden_any is not None and self._forbidden_any.search(text_lower):
+            for pattern, regex in self._forbidden_compiled:
+                m = regex.search(text_lower)
+                if m:
+                    matched = m.group(0)
+                    # Derive a readable concept from the pattern by removing regex tokens
+                    concept = re.sub(r"\\[A-Za-z]", "", pattern)  # remove escaped tokens like \W, \s
+                    concept = re.sub(r"[\[\]\-\_\.\?\s\*]", "", concept)
+                    concept = re.sub(r"[^a-zA-Z]", "", concept).lower()
+                    reason = f"Axiom 6 Violation: Detected pattern '{pattern}' matched '{matched}' (concept='{concept}')"
+                    logger.warning("[GUARDRAIL] VETO: %s", reason)
+                    return (False, reason)
 
         # Fuzzy fallback for obfuscated or misspelled keywords
         if self._fuzzy_match(text_lower):
@@ -61,8 +82,7 @@ class DeontologicalGuardrail:
             best_kw = None
             best_score = 0.0
             matched_sub = ""
-            for kw in self.forbidden_keywords:
-                k = kw.lower()
+            for k in self._keywords_lower:
                 clen = len(k)
                 for i in range(0, max(1, len(text_lower) - clen + 1)):
                     window = text_lower[i : i + clen + 20]
@@ -87,14 +107,9 @@ class DeontologicalGuardrail:
     def _fuzzy_match(self, text: str, threshold: float = 0.85) -> bool:
         """Return True if any forbidden keyword is fuzzily close to text substrings."""
         text_lower = text.lower()
-        for kw in self.forbidden_keywords:
-            k = kw.lower()
-            clen = len(k)
-            if clen == 0:
-                continue
-            # sliding window sizes near the keyword length
-            min_len = max(3, int(clen * 0.6))
-            max_len = int(clen * 1.4) + 1
+        self._refresh_rules()
+        # sliding window sizes near the keyword length
+        for k, min_len, max_len in self._fuzzy_windows:
             for L in range(min_len, max_len + 1):
                 for i in range(0, max(1, len(text_lower) - L + 1)):
                     window = text_lower[i : i + L]
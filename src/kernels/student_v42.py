@@ -10,7 +10,7 @@ Improvements applied in this refactor:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any, Callable, Optional
 import time
 import logging
@@ -20,8 +20,11 @@ from src.primitives.exceptions import StandardizedInfeasibilityToken
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; callers only substitute the per-problem fields.
+_PROMPT_TEMPLATE = "TASK: {task}\nCONTEXT: {context}\nCONSTRAINT: {constraint}\n\nProvide a detailed solution."
 
-@dataclass
+
+@dataclass(slots=True)
 class StudentResult:
     status: str
     solution: Optional[str]
@@ -29,6 +32,20 @@ class StudentResult:
     duration_s: float
     meta: Dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view of the result.
+
+        Cheaper than `dataclasses.asdict`, which deep-copies `meta`; each
+        result owns a freshly built `meta`, so sharing it is safe.
+        """
+        return {
+            "status": self.status,
+            "solution": self.solution,
+            "model_used": self.model_used,
+            "duration_s": self.duration_s,
+            "meta": self.meta,
+        }
+
 
 class StudentKernelV42:
     """A lightweight student kernel that delegates to an LLM.
@@ -65,9 +82,7 @@ class StudentKernelV42:
         context = str(problem.get("data", "")).strip()
         constraint = str(problem.get("constraint", "")).strip()
 
-        full_prompt = (
-            f"TASK: {task_prompt}\nCONTEXT: {context}\nCONSTRAINT: {constraint}\n\nProvide a detailed solution."
-        )
+        full_prompt = _PROMPT_TEMPLATE.format(task=task_prompt, context=context, constraint=constraint)
 
         # Attempt LLM calls with simple retry/backoff
         attempt = 0
@@ -91,15 +106,13 @@ class StudentKernelV42:
                     # If we've exhausted retries, return SIT with reason
                     if attempt > self.max_retries:
                         duration = time.time() - start_time
-                        return asdict(
-                            StudentResult(
-                                status="SIT",
-                                solution=None,
-                                model_used=self.model_name,
-                                duration_s=round(duration, 3),
-                                meta={"reason": str(e), "attempts": attempt},
-                            )
-                        )
+                        return StudentResult(
+                            status="SIT",
+                            solution=None,
+                            model_used=self.model_name,
+                            duration_s=round(duration, 3),
+                            meta={"reason": str(e), "attempts": attempt},
+                        ).to_dict()
                     time.sleep(0.5 * attempt)
                     continue
 
@@ -128,22 +141,20 @@ class StudentKernelV42:
                     duration_s=round(duration, 3),
                     meta={"attempts": attempt, **last_meta},
                 )
-                return asdict(result)
+                return result.to_dict()
 
             except StandardizedInfeasibilityToken:
                 logger.exception("LLM indicated infeasibility or connection error")
                 # If it's the last attempt, return SIT
                 if attempt > self.max_retries:
                     duration = time.time() - start_time
-                    return asdict(
-                        StudentResult(
-                            status="SIT",
-                            solution=None,
-                            model_used=self.model_name,
-                            duration_s=round(duration, 3),
-                            meta={"reason": "LLM infeasible or offline", "attempts": attempt},
-                        )
-                    )
+                    return StudentResult(
+                        status="SIT",
+                        solution=None,
+                        model_used=self.model_name,
+                        duration_s=round(duration, 3),
+                        meta={"reason": "LLM infeasible or offline", "attempts": attempt},
+                    ).to_dict()
                 # else, simple backoff
                 time.sleep(0.5 * attempt)
             
@@ -157,7 +168,7 @@ class StudentKernelV42:
         task_prompt = str(task or "").strip()
         context = str(context or "").strip()
         constraint = str(constraint or "").strip()
-        return f"TASK: {task_prompt}\nCONTEXT: {context}\nCONSTRAINT: {constraint}\n\nProvide a detailed solution."
+        return _PROMPT_TEMPLATE.format(task=task_prompt, context=context, constraint=constraint)
 
     class Metrics:
         """A tiny local metrics helper. Replace with Prometheus/StatsD client in prod.
@@ -234,36 +245,32 @@ class StudentKernelV42:
                     duration_s=round(duration, 3),
                     meta={"attempts": attempt, **last_meta},
                 )
-                return asdict(result)
+                return result.to_dict()
 
             except StandardizedInfeasibilityToken:
                 logger.exception("LLM indicated infeasibility or connection error (async)")
                 if attempt > self.max_retries:
                     duration = time.time() - start_time
-                    return asdict(
-                        StudentResult(
-                            status="SIT",
-                            solution=None,
-                            model_used=self.model_name,
-                            duration_s=round(duration, 3),
-                            meta={"reason": "LLM infeasible or offline", "attempts": attempt},
-                        )
-                    )
+                    return StudentResult(
+                        status="SIT",
+                        solution=None,
+                        model_used=self.model_name,
+                        duration_s=round(duration, 3),
+                        meta={"reason": "LLM infeasible or offline", "attempts": attempt},
+                    ).to_dict()
                 await __import__("asyncio").sleep(0.5 * attempt)
 
             except Exception:
                 logger.exception("Unexpected error in StudentKernelV42 (async)")
                 if attempt > self.max_retries:
                     duration = time.time() - start_time
-                    return asdict(
-                        StudentResult(
-                            status="SIT",
-                            solution=None,
-                            model_used=self.model_name,
-                            duration_s=round(duration, 3),
-                            meta={"reason": "unexpected async error", "attempts": attempt},
-                        )
-                    )
+                    return StudentResult(
+                        status="SIT",
+                        solution=None,
+                        model_used=self.model_name,
+                        duration_s=round(duration, 3),
+                        meta={"reason": "unexpected async error", "attempts": attempt},
+                    ).to_dict()
                 await __import__("asyncio").sleep(0.5 * attempt)
 
             except Exception as e:
@@ -271,13 +278,11 @@ class StudentKernelV42:
                 # If we've exhausted retries, return SIT with reason
                 if attempt > self.max_retries:
                     duration = time.time() - start_time
-                    return asdict(
-                        StudentResult(
-                            status="SIT",
-                            solution=None,
-                            model_used=self.model_name,
-                            duration_s=round(duration, 3),
-                            meta={"reason": str(e), "attempts": attempt},
-                        )
-                    )
+                    return StudentResult(
+                        status="SIT",
+                        solution=None,
+                        model_used=self.model_name,
+                        duration_s=round(duration, 3),
+                        meta={"reason": str(e), "attempts": attempt},
+                    ).to_dict()
                 time.sleep(0.5 * attempt)
\ No newline at end of file
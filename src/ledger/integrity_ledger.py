@@ -2,11 +2,10 @@
 import json
 import time
 import os
-import base64
-import yaml
 from pathlib import Path
 # import rfc3161ng # Uncomment in prod
 from src.utils.crypto import verify_signature
+from src.utils.canonical_json import canonical_json
 from src.utils.ocsf import wrap_ocsf_6003
 from src.ledger.merkle_tree import MerkleTree, sha256
 
@@ -51,14 +50,14 @@ class IntegrityLedger:
         ocsf_event['status'] = 'ESCROWED'
         ocsf_event['ttl_sec'] = self.ttl_sec
         
-        payload_str = json.dumps(ocsf_event, sort_keys=True, separators=(',', ':'))
-        token = sha256b(payload_str.encode())
+        payload = canonical_json(ocsf_event)
+        token = sha256b(payload)
 
         wal_tmp = os.path.join(self.store_dir, f'{token}.precommit.tmp')
         wal_path = os.path.join(self.store_dir, f'{token}.precommit')
 
-        with open(wal_tmp, 'w', encoding='utf-8') as f:
-            f.write(payload_str)
+        with open(wal_tmp, 'wb') as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
 
@@ -99,8 +98,7 @@ class IntegrityLedger:
                 'ts': time.time()
             }
 
-            final_str = json.dumps(entry, sort_keys=True, separators=(',', ':'))
-            leaf_hash = sha256b(final_str.encode())
+            leaf_hash = sha256b(canonical_json(entry))
             entry['hash'] = leaf_hash
             
             self.last_hash = leaf_hash
@@ -141,8 +139,7 @@ class IntegrityLedger:
         })
         block_event['prev_hash'] = self.last_hash
         
-        block_str = json.dumps(block_event, sort_keys=True, separators=(',', ':'))
-        block_event['hash'] = sha256b(block_str.encode())
+        block_event['hash'] = sha256b(canonical_json(block_event))
         self.last_hash = block_event['hash']
         
         self._append_to_chain(block_event)
@@ -183,6 +183,13 @@ def _generate_local(prompt: str, max_tokens: int, temperature: float) -> str:
     return response
 
 
+# Backend name -> generator, resolved with one dict lookup per call
+_GENERATORS = {
+    "http": _generate_http,
+    "local": _generate_local,
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═══════════════════════════════════════════════════════════════════════════
@@ -204,17 +211,13 @@ def generate(prompt: str, max_tokens: int = 512, temperature: float = 1.0) -> st
         ValueError: If QWEN_BACKEND is invalid
         RuntimeError: If backend fails
     """
-    if QWEN_BACKEND == "http":
-        return _generate_http(prompt, max_tokens, temperature)
-    
-    elif QWEN_BACKEND == "local":
-        return _generate_local(prompt, max_tokens, temperature)
-    
-    else:
+    generate_impl = _GENERATORS.get(QWEN_BACKEND)
+    if generate_impl is None:
         raise ValueError(
             f"Invalid QWEN_BACKEND={QWEN_BACKEND!r}. "
             f"Must be 'http' or 'local'."
         )
+    return generate_impl(prompt, max_tokens, temperature)
 
 
 def is_available() -> bool:
@@ -73,6 +73,15 @@ def _generate_openai(prompt: str, max_tokens: int, temperature: float) -> str:
     return response.choices[0].message.content
 
 
+# Backend name -> generator. Add new backends here, e.g.:
+#     "anthropic": _generate_anthropic,
+#     "google": _generate_google,
+_GENERATORS = {
+    "qwen": _generate_qwen,
+    "openai": _generate_openai,
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═══════════════════════════════════════════════════════════════════════════
@@ -94,23 +103,13 @@ def generate_prompt(prompt: str, max_tokens: int = 512, temperature: float = 1.0
         ValueError: If KT_BACKEND is invalid
         RuntimeError: If backend is not available or fails
     """
-    if KT_BACKEND == "qwen":
-        return _generate_qwen(prompt, max_tokens, temperature)
-    
-    elif KT_BACKEND == "openai":
-        return _generate_openai(prompt, max_tokens, temperature)
-    
-    # Add more backends as needed:
-    # elif KT_BACKEND == "anthropic":
-    #     return _generate_anthropic(prompt, max_tokens, temperature)
-    # elif KT_BACKEND == "google":
-    #     return _generate_google(prompt, max_tokens, temperature)
-    
-    else:
+    generate_impl = _GENERATORS.get(KT_BACKEND)
+    if generate_impl is None:
         raise ValueError(
             f"Invalid KT_BACKEND={KT_BACKEND!r}. "
-            f"Supported backends: qwen, openai"
+            f"Supported backends: {', '.join(_GENERATORS)}"
         )
+    return generate_impl(prompt, max_tokens, temperature)
 
 
 def get_backend_status() -> dict[str, Any]:
@@ -4,34 +4,105 @@ AID: /src/llm_interface.py
 Proof ID: PRF-LLM-INT-002
 """
 import os
+import json
+import asyncio
+import time
 import requests
 import logging
-from typing import Any
+from typing import Any, Iterator, List, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 # Default Ollama HTTP endpoint
 OLLAMA_API_URL = os.environ.get("OLLAMA_API", "http://localhost:11434/api/generate")
+_OLLAMA_BASE_URL = OLLAMA_API_URL.replace("/api/generate", "")
+DEFAULT_MODEL = "qwen2.5:3b"
+DEFAULT_TEMPERATURE = 0.7
 
+# Shared keep-alive session: repeated calls reuse pooled TCP connections
+# instead of paying a handshake per request. Transient 5xx responses are
+# retried briefly; the final response is still returned, not raised. Read
+# timeouts are re-raised as-is (read=False), never retried: the POST may
+# already be generating, and exhausting a retry budget would surface them
+# as a ConnectionError ("offline") instead of a ReadTimeout.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        read=False,
+        backoff_factor=0.1,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=None,
+        raise_on_status=False,
+    ),
+))
 
-def query_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: str = "qwen2.5:3b", timeout: int = 60, **kwargs) -> str:
+# Liveness cache for check_connection (monotonic timestamp of last probe)
+_CONN_TTL_S = 2.0
+_CONN_CACHE: dict[str, Any] = {"ts": float("-inf"), "ok": False}
+
+# System rule leads the prompt so repeated calls share a stable, cacheable prefix
+_PROMPT_TEMPLATE = "{system_rule}\n\n{prompt}"
+
+
+def check_connection() -> bool:
+    """Ping the Ollama server to ensure it's alive.
+
+    The result is cached for `_CONN_TTL_S` seconds so tight dispatch loops
+    pay one probe per window instead of one per call.
+    """
+    now = time.monotonic()
+    if now - _CONN_CACHE["ts"] < _CONN_TTL_S:
+        return _CONN_CACHE["ok"]
+    try:
+        res = _SESSION.get(_OLLAMA_BASE_URL, timeout=2)
+        ok = res.status_code == 200
+    except Exception:
+        ok = False
+    _CONN_CACHE["ts"] = now
+    _CONN_CACHE["ok"] = ok
+    return ok
+
+
+def query_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 60, stream: bool = False, **kwargs) -> Union[str, Iterator[str]]:
     """Synapse function to query Qwen via Ollama HTTP API.
 
     Accepts `model` and `timeout` for compatibility with StudentKernel.
     Returns the text response or an error string starting with `[ERROR]` or `[CRITICAL]`.
+    With `stream=True`, returns an iterator of response fragments instead, so
+    callers can consume tokens as Ollama generates them; errors are yielded
+    as a single marker string.
     """
 
-    full_prompt = f"{system_rule}\n\n{prompt}"
+    full_prompt = _PROMPT_TEMPLATE.format(system_rule=system_rule, prompt=prompt)
+    return _generate(full_prompt, model, timeout, stream, **kwargs)
+
+
+def _generate(full_prompt: str, model: str, timeout: int, stream: bool, **kwargs) -> Union[str, Iterator[str]]:
+    """POST an already-formatted prompt to Ollama; see `query_qwen` for the contract."""
+    # None-checks (not `or`) so an explicit temperature=0.0 is honoured
+    temperature = kwargs.get("temperature")
+    options: dict[str, Any] = {"temperature": DEFAULT_TEMPERATURE if temperature is None else temperature}
+    max_tokens = kwargs.get("max_tokens")
+    if max_tokens is not None:
+        options["num_predict"] = max_tokens
 
     payload: dict[str, Any] = {
         "model": model,
         "prompt": full_prompt,
         "stream": False,
-        "options": {"temperature": 0.7},
+        "options": options,
     }
 
+    if stream:
+        return _iter_stream(payload, timeout)
+
     try:
-        resp = requests.post(OLLAMA_API_URL, json=payload, timeout=timeout)
+        resp = _SESSION.post(OLLAMA_API_URL, json=payload, timeout=timeout)
         if resp.status_code != 200:
             logger.error("Ollama API returned %s: %s", resp.status_code, resp.text)
             return f"[ERROR] API returned {resp.status_code}: {resp.text}"
@@ -50,4 +121,49 @@ def query_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: s
         return f"[ERROR] Request timed out after {timeout} seconds."
     except Exception as e:
         logger.exception("Unexpected error querying Ollama API")
-        return f"[ERROR] Connection Fault: {e}"
\ No newline at end of file
+        return f"[ERROR] Connection Fault: {e}"
+
+
+async def aquery_qwen(prompt: str, system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 60, **kwargs) -> str:
+    """Awaitable `query_qwen`: runs the blocking call on a worker thread.
+
+    The event loop stays free during generation, and concurrent calls share
+    the pooled keep-alive session.
+    """
+    return await asyncio.to_thread(query_qwen, prompt, system_rule, model, timeout, False, **kwargs)
+
+
+async def batch_query_qwen(prompts: List[str], system_rule: str = "You are a helpful AI.", model: str = DEFAULT_MODEL, timeout: int = 60, **kwargs) -> List[str]:
+    """Issue independent prompts concurrently; results keep the input order."""
+    return list(await asyncio.gather(
+        *(aquery_qwen(p, system_rule, model, timeout, **kwargs) for p in prompts)
+    ))
+
+
+def _iter_stream(payload: dict[str, Any], timeout: int) -> Iterator[str]:
+    """Yield response fragments from a streaming Ollama generate call."""
+    try:
+        with _SESSION.post(OLLAMA_API_URL, json={**payload, "stream": True}, stream=True, timeout=timeout) as resp:
+            if resp.status_code != 200:
+                logger.error("Ollama API returned %s: %s", resp.status_code, resp.text)
+                yield f"[ERROR] API returned {resp.status_code}: {resp.text}"
+                return
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                fragment = chunk.get("response")
+                if fragment:
+                    yield fragment
+                if chunk.get("done"):
+                    break
+
+    except requests.exceptions.ConnectionError:
+        logger.exception("Connection error to Ollama API")
+        yield "[CRITICAL] Ollama is offline. Is the Docker container running?"
+    except requests.exceptions.ReadTimeout:
+        logger.exception("Ollama API request timed out")
+        yield f"[ERROR] Request timed out after {timeout} seconds."
+    except Exception as e:
+        logger.exception("Unexpected error streaming from Ollama API")
+        yield f"[ERROR] Connection Fault: {e}"
@@ -15,9 +15,12 @@ FILE_PATH = Path(__file__).resolve()
 PROJECT_ROOT = FILE_PATH.parent.parent.parent
 CONFIG_PATH = PROJECT_ROOT / "config" / "ml_eng" / "config_master.yaml"
 
+# libyaml-backed SafeLoader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def load_config():
     try:
-        with open(CONFIG_PATH, 'r') as f: return yaml.safe_load(f)
+        with open(CONFIG_PATH, 'r') as f: return yaml.load(f, Loader=_YAML_LOADER)
     except: return {}
 CONFIG = load_config()
 
@@ -12,14 +12,36 @@ Design notes:
 
 from __future__ import annotations
 
+import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
+# Optional: C-accelerated JSON decoding for structured model replies.
+# orjson.JSONDecodeError subclasses ValueError, same as the stdlib error.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
 
+def _json_schema_format(schema: Dict[str, Any], name: str = "kt_structured_output") -> Dict[str, Any]:
+    """Wrap a JSON schema in the OpenAI-style ``response_format`` envelope.
+
+    Strict mode makes the provider guarantee schema-conformant JSON, so the
+    schema must list every property in ``required`` and set
+    ``additionalProperties: false``.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
+
+
 class KTModelAdapter(ABC):
     """Abstract base class for model adapters.
 
@@ -112,17 +134,39 @@ class OpenAIAdapter(KTModelAdapter):
         self.client = openai
 
     def generate(self, prompt: str, **kwargs: Any) -> str:
+        """Generate text; pass ``json_schema`` to request structured output."""
+        request: Dict[str, Any] = {
+            "model": self.config["model"],
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": int(kwargs.get("max_new_tokens", 256)),
+        }
+        json_schema = kwargs.get("json_schema")
+        if json_schema is not None:
+            request["response_format"] = _json_schema_format(json_schema)
         try:
-            completion = self.client.chat.completions.create(
-                model=self.config["model"],
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=int(kwargs.get("max_new_tokens", 256)),
-            )
+            completion = self.client.chat.completions.create(**request)
             return completion.choices[0].message.content  # type: ignore[index]
         except Exception as e:
             logger.exception("OpenAIAdapter.generate failed: %s", e)
             raise
 
+    def generate_structured(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Structured output requested via ``response_format``.
+
+        The schema is sent to the provider, which may or may not constrain
+        the reply to it; the reply is decoded directly and a non-JSON reply
+        is an error rather than a silent default.
+        """
+        if schema is None:
+            return super().generate_structured(prompt, schema, **kwargs)
+        text = self.generate(prompt, json_schema=schema, **kwargs)
+        return _json_loads(text)
+
 
 class CouncilAdapter(KTModelAdapter):
     """Council of Teachers adapter with role-based routing.
@@ -203,3 +247,22 @@ class CouncilAdapter(KTModelAdapter):
             logger.exception("CouncilAdapter.generate failed: %s", e)
             raise
 
+    def generate_structured(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Structured output via the router's ``response_format`` passthrough.
+
+        The schema reaches both the role specialist and the router's fallback
+        model; whether it is enforced depends on the OpenRouter provider.
+
+        Raises:
+            ValueError: If the specialist reply is not valid JSON.
+        """
+        if schema is None:
+            return super().generate_structured(prompt, schema, **kwargs)
+        text = self.generate(prompt, response_format=_json_schema_format(schema), **kwargs)
+        return _json_loads(text)
+
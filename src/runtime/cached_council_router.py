@@ -0,0 +1,224 @@
+"""Response cache in front of the Council Router.
+
+AID: /src/runtime/cached_council_router.py
+
+Wraps a CouncilRouter so repeated identical requests (same role, prompt,
+system message and sampling parameters) are answered from a local cache
+instead of a paid OpenRouter round-trip. Entries live in an in-memory LRU
+and, optionally, in a SQLite file so hits survive across batch runs.
+
+Concurrent callers asking for the same uncached request share a single
+in-flight call instead of each paying for their own.
+
+Only cache calls whose answer may legitimately be reused: generation steps
+that rely on sampling diversity should pass ``use_cache=False``.
+
+Usage:
+    council = CachedCouncilRouter(CouncilRouter(), db_path="council_cache.db")
+    grade = council.route_request("ARBITER", f"Grade this: {paradox}")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from src.runtime.council_router import CouncilRouter
+
+logger = logging.getLogger(__name__)
+
+
+class CachedCouncilRouter:
+    """CouncilRouter decorator with an LRU + optional SQLite response cache.
+
+    Attributes:
+        router: The wrapped CouncilRouter that serves cache misses
+        maxsize: Maximum number of entries kept in memory
+        ttl_sec: Entry lifetime in seconds (None = never expires)
+    """
+
+    def __init__(
+        self,
+        router: Optional[CouncilRouter] = None,
+        maxsize: int = 1024,
+        ttl_sec: Optional[float] = None,
+        db_path: Optional[str] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            router: Router to delegate misses to (a new CouncilRouter if None)
+            maxsize: In-memory LRU capacity
+            ttl_sec: Entry lifetime in seconds; None keeps entries indefinitely
+            db_path: SQLite file for a persistent second tier (None = memory only)
+        """
+        self.router = router if router is not None else CouncilRouter()
+        self.maxsize = maxsize
+        self.ttl_sec = ttl_sec
+        self._memory: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS council_cache "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def __getattr__(self, name: str) -> Any:
+        # Roster management and anything else falls through to the wrapped router
+        if name == "router":
+            raise AttributeError(name)
+        return getattr(self.router, name)
+
+    def route_request(
+        self,
+        role: str,
+        prompt: str,
+        system_msg: str = "",
+        temperature: Optional[float] = None,
+        max_tokens: int = 2048,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> str:
+        """Route a request, serving identical earlier requests from cache.
+
+        Args:
+            role: Specialist role (DEAN, ENGINEER, ARBITER, TA)
+            prompt: User prompt/task description
+            system_msg: System message for role/context setting
+            temperature: Override default temperature for this role
+            max_tokens: Maximum tokens to generate
+            use_cache: Set False to always call the router (result not stored)
+            **kwargs: Additional parameters passed to the API
+
+        Returns:
+            Generated (or cached) text response
+        """
+        if not use_cache:
+            return self.router.route_request(
+                role, prompt, system_msg=system_msg, temperature=temperature,
+                max_tokens=max_tokens, **kwargs,
+            )
+
+        key = self._key(role, prompt, system_msg, temperature, max_tokens, kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            logger.debug("[COUNCIL-CACHE] hit %s (%s)", key[:12], role)
+            return cached
+
+        # Join an identical request already in flight rather than issuing another
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._inflight[key] = future = Future()
+        if pending is not None:
+            logger.debug("[COUNCIL-CACHE] joined in-flight %s (%s)", key[:12], role)
+            return pending.result()
+
+        try:
+            response = self.router.route_request(
+                role, prompt, system_msg=system_msg, temperature=temperature,
+                max_tokens=max_tokens, **kwargs,
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            # Release followers before touching the cache; a failed write only
+            # costs a future miss
+            future.set_result(response)
+            try:
+                self._put(key, response)
+            except Exception as e:
+                logger.warning("[COUNCIL-CACHE] store failed for %s: %s", key[:12], e)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry (memory and SQLite)."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM council_cache")
+                self._db.commit()
+
+    @staticmethod
+    def _key(
+        role: str,
+        prompt: str,
+        system_msg: str,
+        temperature: Optional[float],
+        max_tokens: int,
+        extra: dict,
+    ) -> str:
+        material = json.dumps(
+            {
+                "role": role,
+                "system_msg": system_msg,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "extra": extra,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _expiry(self) -> float:
+        return float("inf") if self.ttl_sec is None else time.time() + self.ttl_sec
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT response, expires_at FROM council_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, expires_at = row
+            if expires_at <= now:
+                self._db.execute("DELETE FROM council_cache WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._remember(key, expires_at, response)
+            return response
+
+    def _put(self, key: str, response: str) -> None:
+        expires_at = self._expiry()
+        with self._lock:
+            self._remember(key, expires_at, response)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO council_cache (key, response, expires_at) VALUES (?, ?, ?)",
+                    (key, response, expires_at),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, response: str) -> None:
+        # Caller holds self._lock
+        self._memory[key] = (expires_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
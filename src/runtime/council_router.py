@@ -29,6 +29,13 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Per-role default sampling temperature, used when the caller doesn't override
+_ROLE_TEMPERATURES: Dict[str, float] = {
+    "ARBITER": 0.1,  # Low temp for consistent judgment
+    "DEAN": 0.8,     # Higher for creative reasoning
+}
+_DEFAULT_TEMPERATURE = 0.7  # Balanced default
+
 
 class CouncilRouter:
     """Multi-model router with role-based specialist selection.
@@ -132,12 +139,7 @@ class CouncilRouter:
 
         # 2. Configure Special Parameters based on Role
         if temperature is None:
-            if role == "ARBITER":
-                temperature = 0.1  # Low temp for consistent judgment
-            elif role == "DEAN":
-                temperature = 0.8  # Higher for creative reasoning
-            else:
-                temperature = 0.7  # Balanced default
+            temperature = _ROLE_TEMPERATURES.get(role, _DEFAULT_TEMPERATURE)
 
         # 3. Execute Call
         try:
@@ -156,7 +158,7 @@ class CouncilRouter:
         except Exception as e:
             logger.warning("[ERROR] Error with %s: %s", model_id, e)
             # Fallback to a TA if the Specialist fails
-            return self._fallback_call(prompt, system_msg, temperature, max_tokens)
+            return self._fallback_call(prompt, system_msg, temperature, max_tokens, **kwargs)
 
     def _call_model(
         self,
@@ -218,6 +220,7 @@ class CouncilRouter:
         system_msg: str,
         temperature: float,
         max_tokens: int,
+        **kwargs: Any,
     ) -> str:
         """Execute fallback call when primary specialist fails.
         
@@ -226,6 +229,7 @@ class CouncilRouter:
             system_msg: System message
             temperature: Sampling temperature
             max_tokens: Max tokens to generate
+            **kwargs: Additional API parameters (e.g. response_format)
             
         Returns:
             Generated text from fallback model
@@ -238,6 +242,7 @@ class CouncilRouter:
                 system_msg=system_msg,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                **kwargs,
             )
         except Exception as e:
             logger.error("[ERROR] Fallback model failed: %s", e)
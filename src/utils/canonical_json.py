@@ -0,0 +1,15 @@
+"""
+AID: /src/utils/canonical_json.py
+Purpose: Canonical (sorted-key, compact, ASCII) JSON bytes for ledger hashing.
+"""
+import json
+
+
+def canonical_json(obj) -> bytes:
+    """Serialize `obj` as sorted-key, compact JSON bytes.
+
+    Stdlib only: hashes feed audit chains, so the byte layout must not depend
+    on which optional serializer happens to be installed. Output matches the
+    ledger's original json.dumps(sort_keys=True, separators=(',', ':')).
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
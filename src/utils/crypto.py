@@ -1,8 +1,14 @@
 ﻿import base64
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives import serialization
+import os
+from functools import lru_cache
+
+# cryptography is imported inside the functions so importing the ledger
+# (and the API server that builds one) doesn't load OpenSSL bindings up front.
 
 def generate_keypair(name, key_dir='keys'):
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+    from cryptography.hazmat.primitives import serialization
+
     priv = ed25519.Ed25519PrivateKey.generate()
     pub = priv.public_key()
 
@@ -19,14 +25,25 @@ def generate_keypair(name, key_dir='keys'):
             format=serialization.PublicFormat.OpenSSH
         ))
 
+@lru_cache(maxsize=8)
+def _load_pub_key(pub_key_path, file_id: tuple):
+    # Keyed on (inode, size, mtime, ctime) so a rotated key file is re-parsed,
+    # even one copied in with its mtime preserved (cp -p, rsync -t)
+    from cryptography.hazmat.primitives import serialization
+
+    with open(pub_key_path, 'rb') as f:
+        return serialization.load_ssh_public_key(f.read())
+
 def verify_signature(pub_key_path, data: bytes, signature_b64: str) -> bool:
     try:
-        with open(pub_key_path, 'rb') as f:
-            pub_bytes = f.read()
-            pub_key = serialization.load_ssh_public_key(pub_bytes)
+        st = os.stat(pub_key_path)
+        pub_key = _load_pub_key(pub_key_path, (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns))
 
         sig_bytes = base64.b64decode(signature_b64)
         pub_key.verify(sig_bytes, data)
         return True
+    except ImportError:
+        # Missing cryptography is a deployment error, not a bad signature
+        raise
     except Exception:
         return False